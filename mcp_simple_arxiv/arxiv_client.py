@@ -3,37 +3,286 @@ arXiv API client with rate limiting.
 """
 
 import asyncio
+import hashlib
+import io
+import json
 import logging
-from datetime import datetime, timedelta
-import feedparser
+import os
+import re
+import time
+import xml.etree.ElementTree as ET
+from collections import OrderedDict, defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
 import httpx
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Namespace prefixes used in arXiv's Atom responses
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+
+# Qualified tag names, precomputed once instead of concatenated per entry
+_ATOM_ENTRY = _ATOM + 'entry'
+_ATOM_ID = _ATOM + 'id'
+_ATOM_TITLE = _ATOM + 'title'
+_ATOM_LINK = _ATOM + 'link'
+_ATOM_AUTHOR_NAME = _ATOM + 'author/' + _ATOM + 'name'
+_ATOM_CATEGORY = _ATOM + 'category'
+_ATOM_PUBLISHED = _ATOM + 'published'
+_ATOM_UPDATED = _ATOM + 'updated'
+_ATOM_SUMMARY = _ATOM + 'summary'
+_ARXIV_PRIMARY_CATEGORY = _ARXIV + 'primary_category'
+_ARXIV_COMMENT = _ARXIV + 'comment'
+_ARXIV_JOURNAL_REF = _ARXIV + 'journal_ref'
+_ARXIV_DOI = _ARXIV + 'doi'
+
+# Collapses runs of whitespace (including newlines) to single spaces
+_WS_RE = re.compile(r"\s+")
+
+# Trailing version suffix on arXiv ids (e.g. the v2 in 2103.08220v2)
+_VERSION_SUFFIX_RE = re.compile(r"v\d+$")
+
+@dataclass(slots=True, frozen=True)
+class Paper:
+    """
+    A parsed arXiv paper record.
+
+    Slots keep per-entry memory well below a 13-key dict for large result
+    sets, and frozen instances are safe to share between cache tiers.
+    """
+    id: str
+    title: str
+    authors: Tuple[str, ...]
+    primary_category: Optional[str]
+    categories: Tuple[str, ...]
+    published: str
+    updated: str
+    summary: str
+    comment: str
+    journal_ref: str
+    doi: str
+    pdf_url: Optional[str]
+    abstract_url: Optional[str]  # URL to abstract page
+    html_url: Optional[str]  # URL to HTML version if available
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for JSON serialization."""
+        data = asdict(self)
+        data["authors"] = list(self.authors)
+        data["categories"] = list(self.categories)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Paper":
+        """Rebuild a Paper from a dict produced by to_dict."""
+        return cls(**{
+            **data,
+            "authors": tuple(data["authors"]),
+            "categories": tuple(data["categories"]),
+        })
+
 class ArxivClient:
     """
     arXiv API client with built-in rate limiting.
     Ensures no more than 1 request every 3 seconds.
     """
-    
+
+    # TTLs for the in-memory result caches. Search results can change as new
+    # papers are submitted; individual papers rarely change once published.
+    _SEARCH_CACHE_TTL = 300  # seconds
+    _PAPER_CACHE_TTL = 3600  # seconds
+    _CACHE_MAX = 128  # max entries per cache (LRU eviction)
+    # Validators for conditional GETs stay useful much longer than the
+    # result caches; the TTL mainly stops stale payloads living forever
+    _ETAG_CACHE_TTL = 86400  # seconds
+
+    # Micro-batching of get_paper calls: concurrent lookups arriving within
+    # this window are combined into a single id_list request.
+    _BATCH_WINDOW = 0.05  # seconds
+    _BATCH_MAX = 100  # ids per id_list request
+
+    # Circuit breaker: after this many consecutive HTTP errors, fail fast
+    # for the cooldown period instead of queueing more doomed requests
+    _BREAKER_THRESHOLD = 5
+    _BREAKER_COOLDOWN = 30.0  # seconds
+
     def __init__(self):
         self.base_url = "http://export.arxiv.org/api/query"
-        self._last_request: Optional[datetime] = None
-        self._lock = asyncio.Lock()
+        # Rate limiting is tracked per endpoint so unrelated calls (e.g. a
+        # search and a paper fetch) don't serialize behind one global lock.
+        # Cache hits never touch the limiter at all.
+        self._endpoint_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._rate_buckets: Dict[str, Tuple[float, float]] = {}  # endpoint -> (tokens, last refill)
+        # Shared HTTP client, created lazily so pooled connections are
+        # reused across requests instead of re-handshaking every call
+        self._client: Optional[httpx.AsyncClient] = None
+        # Bound in-flight fetches so retry storms can't pile up coroutines,
+        # and track consecutive failures for the circuit breaker
+        self._fetch_sem = asyncio.BoundedSemaphore(1)
+        self._fail_count = 0
+        self._blocked_until = 0.0
+        # Cache of (etag, last-modified, parsed result) per request key, used
+        # to issue conditional GETs and skip re-parsing on HTTP 304 responses.
+        # TTL/LRU-bounded like the result caches: batch compositions rarely
+        # repeat, so unbounded growth would leak in a long-running server.
+        self._etag_cache: OrderedDict[
+            str, Tuple[float, Tuple[Optional[str], Optional[str], Any]]
+        ] = OrderedDict()
+        # TTL-bounded LRU caches of parsed results, keyed by request arguments.
+        # Hits return immediately without waiting on the rate limiter.
+        self._search_cache: OrderedDict[str, Tuple[float, List[Paper]]] = OrderedDict()
+        self._paper_cache: OrderedDict[str, Tuple[float, Paper]] = OrderedDict()
+        # Second cache tier: parsed results persisted to disk, so repeated
+        # queries skip HTTP and feed parsing even across process restarts.
+        # Pending get_paper lookups awaiting the next batch flush
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        cache_root = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+        self._cache_dir = cache_root / "mcp-simple-arxiv"
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Disk cache disabled, cannot create {self._cache_dir}: {e}")
+            self._cache_dir = None
         
-    async def _wait_for_rate_limit(self) -> None:
-        """Ensures we respect arXiv's rate limit of 1 request every 3 seconds."""
-        async with self._lock:
-            if self._last_request is not None:
-                elapsed = datetime.now() - self._last_request
-                if elapsed < timedelta(seconds=3):
-                    await asyncio.sleep(3 - elapsed.total_seconds())
-            self._last_request = datetime.now()
+    # Seconds to accrue one request token (arXiv policy: one request per 3 s)
+    _RATE_INTERVAL = 3.0
+
+    async def _wait_for_rate_limit(self, endpoint: str = "query") -> None:
+        """
+        Ensures we respect arXiv's rate limit of 1 request every 3 seconds.
+
+        Implemented as a token bucket (capacity 1, refilling one token per
+        3 seconds): the first request after an idle period proceeds
+        immediately, while sustained traffic averages out to the allowed
+        rate. Cache hits never reach the limiter at all.
+        """
+        async with self._endpoint_locks[endpoint]:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            tokens, last_refill = self._rate_buckets.get(endpoint, (1.0, now))
+            tokens = min(1.0, tokens + (now - last_refill) / self._RATE_INTERVAL)
+            if tokens < 1.0:
+                await asyncio.sleep((1.0 - tokens) * self._RATE_INTERVAL)
+                now = loop.time()
+            self._rate_buckets[endpoint] = (0.0, now)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            # No explicit Accept-Encoding: httpx advertises every codec it
+            # can transparently decode (gzip, deflate, plus brotli/zstd when
+            # installed), so the Atom payloads arrive compressed
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60),
+                headers={
+                    "User-Agent": "mcp-simple-arxiv (+https://github.com/andybrandt/mcp-simple-arxiv)",
+                },
+            )
+        return self._client
+
+    def _check_circuit_breaker(self) -> None:
+        """Fail fast while the breaker is open after repeated API errors."""
+        if asyncio.get_running_loop().time() < self._blocked_until:
+            raise ValueError(
+                "arXiv API temporarily unavailable after repeated errors; "
+                "retry shortly"
+            )
+
+    def _record_failure(self) -> None:
+        """Count a failed request, opening the breaker past the threshold."""
+        self._fail_count += 1
+        if self._fail_count >= self._BREAKER_THRESHOLD:
+            self._blocked_until = (
+                asyncio.get_running_loop().time() + self._BREAKER_COOLDOWN
+            )
+            self._fail_count = 0
+            logger.warning(
+                f"Circuit breaker open: failing fast for {self._BREAKER_COOLDOWN}s "
+                f"after {self._BREAKER_THRESHOLD} consecutive arXiv API errors"
+            )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: str, ttl: float) -> Optional[Any]:
+        """Return a cached value if present and fresh, else None."""
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        ts, value = cached
+        if time.monotonic() - ts >= ttl:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return value
+
+    @classmethod
+    def _cache_put(cls, cache: OrderedDict, key: str, value: Any) -> None:
+        """Insert a value into a cache, evicting the oldest entry if full."""
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > cls._CACHE_MAX:
+            cache.popitem(last=False)
+
+    def _disk_key(self, kind: str, *args: str) -> Optional[Path]:
+        """Return the disk cache path for a request, or None if disabled."""
+        if self._cache_dir is None:
+            return None
+        digest = hashlib.blake2b("|".join(args).encode()).hexdigest()[:16]
+        return self._cache_dir / f"{kind}_{digest}.json"
+
+    @staticmethod
+    def _disk_get(path: Optional[Path], ttl: float) -> Optional[Any]:
+        """Load a cached result from disk if present and fresh, else None."""
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime < ttl:
+                return json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _disk_put(path: Optional[Path], value: Any) -> None:
+        """Persist a parsed result to disk, ignoring write failures."""
+        if path is None:
+            return
+        try:
+            path.write_text(json.dumps(value), encoding='utf-8')
+        except OSError as e:
+            logger.debug(f"Failed to write disk cache {path}: {e}")
+
+    @staticmethod
+    def _etag_key(*parts: str) -> str:
+        """Build a cache key for the conditional-request cache."""
+        return hashlib.blake2b("|".join(parts).encode()).hexdigest()
+
+    @staticmethod
+    def _conditional_headers(
+        cached: Optional[Tuple[Optional[str], Optional[str], Any]]
+    ) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from a cache entry."""
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        return headers
 
     def _clean_text(self, text: str) -> str:
         """Clean up text by removing extra whitespace and newlines."""
-        return " ".join(text.split())
+        return _WS_RE.sub(" ", text).strip() if text else ""
 
     def _get_html_url(self, arxiv_id: str) -> str:
         """
@@ -46,72 +295,91 @@ class ArxivClient:
         base_id = arxiv_id.split('v')[0]
         return f"https://arxiv.org/html/{arxiv_id}"
 
-    def _parse_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
-        """Parse a feed entry into a paper dictionary."""
+    def _parse_entry(self, entry: ET.Element) -> Paper:
+        """Parse an Atom entry element into a Paper record."""
+        # Hoist method lookups out of the per-field/per-author hot path
+        findtext = entry.findtext
+        clean_text = self._clean_text
+
         # Extract PDF and HTML links
         pdf_url = None
         abstract_url = None  # This is the URL to the abstract page
-        for link in entry.get('links', []):
-            if isinstance(link, dict):
-                if link.get('type') == 'application/pdf':
-                    pdf_url = link.get('href')
-                elif link.get('type') == 'text/html':
-                    abstract_url = link.get('href')
-
-        # Get paper ID
-        paper_id = entry.get('id', '').split("/abs/")[-1].rstrip()
-        
+        for link in entry.findall(_ATOM_LINK):
+            link_type = link.get('type')
+            if link_type == 'application/pdf':
+                pdf_url = link.get('href')
+            elif link_type == 'text/html':
+                abstract_url = link.get('href')
+
+        # Get paper ID; rpartition takes the tail directly instead of
+        # splitting the whole URL into a throwaway list
+        paper_id = (findtext(_ATOM_ID) or '').rpartition("/abs/")[2].rstrip("/")
+
         # Create HTML version URL
         html_url = self._get_html_url(paper_id) if paper_id else None
 
         # Get authors
-        authors = []
-        for author in entry.get('authors', []):
-            if isinstance(author, dict) and 'name' in author:
-                authors.append(author['name'])
-            elif hasattr(author, 'name'):
-                authors.append(author.name)
-
-        # Get categories
-        categories = []
-        primary_category = None
-        
+        authors = [
+            name.text
+            for name in entry.findall(_ATOM_AUTHOR_NAME)
+            if name.text
+        ]
+
         # Get primary category
-        if 'arxiv_primary_category' in entry:
-            if isinstance(entry['arxiv_primary_category'], dict):
-                primary_category = entry['arxiv_primary_category'].get('term')
-            elif hasattr(entry['arxiv_primary_category'], 'term'):
-                primary_category = entry['arxiv_primary_category'].term
-        
+        primary = entry.find(_ARXIV_PRIMARY_CATEGORY)
+        primary_category = primary.get('term') if primary is not None else None
+
         # Get all categories
-        for category in entry.get('tags', []):
-            if isinstance(category, dict) and 'term' in category:
-                categories.append(category['term'])
-            elif hasattr(category, 'term'):
-                categories.append(category.term)
+        categories = [
+            category.get('term')
+            for category in entry.findall(_ATOM_CATEGORY)
+            if category.get('term')
+        ]
 
         # Remove primary category from regular categories if it's there
         if primary_category and primary_category in categories:
             categories.remove(primary_category)
 
-        return {
-            "id": paper_id,
-            "title": self._clean_text(entry.get('title', '')),
-            "authors": authors,
-            "primary_category": primary_category,
-            "categories": categories,
-            "published": entry.get('published', ''),
-            "updated": entry.get('updated', ''),
-            "summary": self._clean_text(entry.get('summary', '')),
-            "comment": self._clean_text(entry.get('arxiv_comment', '')),
-            "journal_ref": entry.get('arxiv_journal_ref', ''),
-            "doi": entry.get('arxiv_doi', ''),
-            "pdf_url": pdf_url,
-            "abstract_url": abstract_url,  # URL to abstract page
-            "html_url": html_url  # URL to HTML version if available
-        }
+        return Paper(
+            id=paper_id,
+            title=clean_text(findtext(_ATOM_TITLE) or ''),
+            authors=tuple(authors),
+            primary_category=primary_category,
+            categories=tuple(categories),
+            published=findtext(_ATOM_PUBLISHED) or '',
+            updated=findtext(_ATOM_UPDATED) or '',
+            summary=clean_text(findtext(_ATOM_SUMMARY) or ''),
+            comment=clean_text(findtext(_ARXIV_COMMENT) or ''),
+            journal_ref=findtext(_ARXIV_JOURNAL_REF) or '',
+            doi=findtext(_ARXIV_DOI) or '',
+            pdf_url=pdf_url,
+            abstract_url=abstract_url,
+            html_url=html_url,
+        )
+
+    def _parse_atom(self, xml_bytes: bytes) -> List[Paper]:
+        """
+        Parse an Atom feed into a list of Paper records.
+
+        Streams the feed with iterparse, emitting each entry as its closing
+        tag is seen and clearing it afterwards, so memory stays flat even
+        for large result sets.
+        """
+        papers = []
+        append = papers.append
+        parse_entry = self._parse_entry
+        try:
+            for _, element in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+                if element.tag == _ATOM_ENTRY:
+                    append(parse_entry(element))
+                    element.clear()
+        except ET.ParseError as e:
+            logger.error(f"Invalid response from arXiv API: {e}")
+            logger.debug(f"Response bytes: {xml_bytes[:1000]!r}...")
+            raise ValueError("Invalid response from arXiv API")
+        return papers
 
-    async def search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+    async def search(self, query: str, max_results: int = 10) -> List[Paper]:
         """
         Search arXiv papers.
         
@@ -127,11 +395,24 @@ class ArxivClient:
         - ti:"neural networks" AND cat:cs.AI  (title with category)
         - au:bengio AND ti:"deep learning"  (author and title)
         """
-        await self._wait_for_rate_limit()
-        
         # Ensure max_results is within API limits
         max_results = min(max_results, 2000)  # API limit: 2000 per request
-        
+
+        lru_key = f"{query}|{max_results}"
+        cached = self._cache_get(self._search_cache, lru_key, self._SEARCH_CACHE_TTL)
+        if cached is not None:
+            return cached
+
+        disk_path = self._disk_key("search", query, str(max_results))
+        cached = self._disk_get(disk_path, self._SEARCH_CACHE_TTL)
+        if cached is not None:
+            papers = [Paper.from_dict(d) for d in cached]
+            self._cache_put(self._search_cache, lru_key, papers)
+            return papers
+
+        self._check_circuit_breaker()
+        await self._wait_for_rate_limit("search")
+
         params = {
             "search_query": query,
             "max_results": max_results,
@@ -139,67 +420,208 @@ class ArxivClient:
             "sortOrder": "descending",
         }
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                
-                # Parse the Atom feed response
-                feed = feedparser.parse(response.text)
-                
-                if not isinstance(feed, dict) or 'entries' not in feed:
-                    logger.error("Invalid response from arXiv API")
-                    logger.debug(f"Response text: {response.text[:1000]}...")
-                    raise ValueError("Invalid response from arXiv API")
-                    
-                if not feed.get('entries'):
-                    # Empty results are ok - return empty list
-                    return []
-                
-                return [self._parse_entry(entry) for entry in feed.entries]
-                
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP error while searching: {e}")
-                raise ValueError(f"arXiv API HTTP error: {str(e)}")
+        cache_key = self._etag_key("search", query, str(max_results))
+        etag_cached = self._cache_get(self._etag_cache, cache_key, self._ETAG_CACHE_TTL)
+
+        client = self._get_client()
+        try:
+            async with self._fetch_sem:
+                response = await client.get(
+                    self.base_url, params=params,
+                    headers=self._conditional_headers(etag_cached)
+                )
+            if response.status_code == 304 and etag_cached is not None:
+                # Feed unchanged - return the previously parsed result
+                self._fail_count = 0
+                return etag_cached[2]
+            response.raise_for_status()
+            self._fail_count = 0
+
+            body = response.content
+            if b">0</opensearch:totalResults>" in body[:2048]:
+                # Empty result set - a byte scan of the feed header is far
+                # cheaper than parsing the XML just to find no entries
+                papers = []
+            else:
+                # Parse the Atom feed response off the event loop so other
+                # tool calls stay responsive during large parses
+                papers = await asyncio.to_thread(self._parse_atom, body)
+            self._cache_put(self._search_cache, lru_key, papers)
+            self._disk_put(disk_path, [paper.to_dict() for paper in papers])
+            self._cache_put(self._etag_cache, cache_key, (
+                response.headers.get("etag"),
+                response.headers.get("last-modified"),
+                papers,
+            ))
+            return papers
+
+        except httpx.HTTPError as e:
+            self._record_failure()
+            logger.error(f"HTTP error while searching: {e}")
+            raise ValueError(f"arXiv API HTTP error: {str(e)}")
             
-    async def get_paper(self, paper_id: str) -> Dict[str, Any]:
+    async def get_paper(self, paper_id: str) -> Paper:
         """
         Get detailed information about a specific paper.
-        
+
         Args:
             paper_id: arXiv paper ID (e.g., "2103.08220")
-            
+
         Returns:
-            Dictionary containing paper metadata, including:
+            Paper record containing paper metadata, including:
             - Basic metadata (title, authors, dates)
             - Categories (primary and others)
             - Abstract and comments
             - URLs (abstract page, PDF version, HTML version if available)
             - DOI if available
+
+        Concurrent calls arriving within a short window are combined into
+        a single id_list request, sharing one rate-limit wait.
         """
-        await self._wait_for_rate_limit()
-        
+        cached = self._lookup_cached_paper(paper_id)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.setdefault(paper_id, []).append(future)
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self._BATCH_WINDOW,
+                lambda: asyncio.ensure_future(self._flush_pending())
+            )
+        return await future
+
+    async def get_papers(self, paper_ids: List[str]) -> List[Paper]:
+        """
+        Get detailed information about several papers in one API call.
+
+        Packs up to 100 ids into a single id_list query instead of issuing
+        one rate-limited request per paper. Results are returned in the
+        order of the input ids.
+
+        Args:
+            paper_ids: arXiv paper IDs (e.g., ["2103.08220", "1706.03762"])
+
+        Raises:
+            ValueError: if any requested paper is not found
+        """
+        results: Dict[str, Paper] = {}
+        missing: List[str] = []
+        for pid in paper_ids:
+            cached = self._lookup_cached_paper(pid)
+            if cached is not None:
+                results[pid] = cached
+            elif pid not in missing:
+                missing.append(pid)
+
+        for start in range(0, len(missing), self._BATCH_MAX):
+            chunk = missing[start:start + self._BATCH_MAX]
+            fetched = await self._fetch_papers_by_id(chunk)
+            results.update((pid, fetched[pid]) for pid in chunk if pid in fetched)
+
+        papers = []
+        for pid in paper_ids:
+            if pid not in results:
+                raise ValueError(f"Paper not found: {pid}")
+            papers.append(results[pid])
+        return papers
+
+    def _lookup_cached_paper(self, paper_id: str) -> Optional[Paper]:
+        """Check both cache tiers for a paper, promoting disk hits to memory."""
+        cached = self._cache_get(self._paper_cache, paper_id, self._PAPER_CACHE_TTL)
+        if cached is not None:
+            return cached
+        cached = self._disk_get(self._disk_key("paper", paper_id), self._PAPER_CACHE_TTL)
+        if cached is None:
+            return None
+        paper = Paper.from_dict(cached)
+        self._cache_put(self._paper_cache, paper_id, paper)
+        return paper
+
+    async def _flush_pending(self) -> None:
+        """Resolve pending get_paper futures with batched id_list requests."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        ids = list(pending)
+        for start in range(0, len(ids), self._BATCH_MAX):
+            chunk = ids[start:start + self._BATCH_MAX]
+            try:
+                papers = await self._fetch_papers_by_id(chunk)
+            except Exception as e:
+                for pid in chunk:
+                    for future in pending[pid]:
+                        if not future.done():
+                            future.set_exception(e)
+                continue
+            for pid in chunk:
+                paper = papers.get(pid)
+                for future in pending[pid]:
+                    if future.done():
+                        continue
+                    if paper is None:
+                        future.set_exception(ValueError(f"Paper not found: {pid}"))
+                    else:
+                        future.set_result(paper)
+
+    async def _fetch_papers_by_id(self, paper_ids: List[str]) -> Dict[str, Paper]:
+        """
+        Fetch a batch of papers with a single id_list request.
+
+        Returns a dict mapping each requested id to its parsed paper;
+        ids arXiv doesn't know are absent from the result.
+        """
+        self._check_circuit_breaker()
+        await self._wait_for_rate_limit("papers")
+
         params = {
-            "id_list": paper_id,
-            "max_results": 1
+            "id_list": ",".join(paper_ids),
+            "max_results": len(paper_ids)
         }
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                
-                feed = feedparser.parse(response.text)
-                if not isinstance(feed, dict) or 'entries' not in feed:
-                    logger.error("Invalid response from arXiv API")
-                    logger.debug(f"Response text: {response.text[:1000]}...")
-                    raise ValueError("Invalid response from arXiv API")
-                
-                if not feed.get('entries'):
-                    raise ValueError(f"Paper not found: {paper_id}")
-                    
-                return self._parse_entry(feed.entries[0])
-                
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP error while fetching paper: {e}")
-                raise ValueError(f"arXiv API HTTP error: {str(e)}")
+        cache_key = self._etag_key("paper", *paper_ids)
+        etag_cached = self._cache_get(self._etag_cache, cache_key, self._ETAG_CACHE_TTL)
+
+        client = self._get_client()
+        try:
+            async with self._fetch_sem:
+                response = await client.get(
+                    self.base_url, params=params,
+                    headers=self._conditional_headers(etag_cached)
+                )
+            if response.status_code == 304 and etag_cached is not None:
+                # Papers unchanged - return the previously parsed result
+                self._fail_count = 0
+                return etag_cached[2]
+            response.raise_for_status()
+            self._fail_count = 0
+
+            entries = await asyncio.to_thread(self._parse_atom, response.content)
+
+        except httpx.HTTPError as e:
+            self._record_failure()
+            logger.error(f"HTTP error while fetching papers: {e}")
+            raise ValueError(f"arXiv API HTTP error: {str(e)}")
+
+        # Map entries back to the requested ids; arXiv returns versioned ids
+        # (e.g. 2103.08220v2) even when queried without a version suffix
+        by_id: Dict[str, Paper] = {}
+        for paper in entries:
+            full_id = paper.id
+            by_id[full_id] = paper
+            by_id.setdefault(_VERSION_SUFFIX_RE.sub('', full_id), paper)
+
+        results: Dict[str, Paper] = {}
+        for pid in paper_ids:
+            paper = by_id.get(pid)
+            if paper is not None:
+                results[pid] = paper
+                self._cache_put(self._paper_cache, pid, paper)
+                self._disk_put(self._disk_key("paper", pid), paper.to_dict())
+
+        self._cache_put(self._etag_cache, cache_key, (
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+            results,
+        ))
+        return results
@@ -7,16 +7,18 @@ sys.stdout.reconfigure(encoding='utf-8')
 sys.stdin.reconfigure(encoding='utf-8')
 
 import asyncio
+import functools
 import json
 import logging
-from typing import Any, Sequence
+import os
+from typing import Any, Optional, Sequence
 
 from mcp.server import Server
 import mcp.types as types
 from mcp.server.stdio import stdio_server
 
 from .arxiv_client import ArxivClient
-from .update_taxonomy import load_taxonomy, update_taxonomy_file
+from .update_taxonomy import TAXONOMY_FILE, load_taxonomy, update_taxonomy_file
 
 logger = logging.getLogger(__name__)
 
@@ -32,17 +34,92 @@ def get_first_sentence(text: str, max_len: int = 200) -> str:
         return text[:max_len].rstrip() + '...'
     return text
 
+# Static usage notes appended to every list_categories response
+_CATEGORY_USAGE_FOOTER = (
+    "\nUsage in search:\n"
+    '- Search in specific category: cat:cs.AI\n'
+    '- Combine with other terms: "neural networks" AND cat:cs.AI\n'
+    '- Multiple categories: (cat:cs.AI OR cat:cs.LG)\n'
+    '\nNote: If categories seem outdated, use the update_categories tool to refresh them.\n'
+)
+
+@functools.lru_cache(maxsize=32)
+def _render_categories(taxonomy_mtime: float, primary_filter: Optional[str]) -> str:
+    """
+    Render the category listing text.
+
+    Cached on the taxonomy file's mtime so repeated calls reuse the
+    formatted output until update_categories rewrites the file.
+    """
+    taxonomy = load_taxonomy()
+    parts = ["arXiv Categories:\n\n"]
+
+    for primary, data in taxonomy.items():
+        if primary_filter and primary != primary_filter:
+            continue
+
+        parts.append(f"{primary}: {data['name']}\n")
+        for code, desc in data['subcategories'].items():
+            parts.append(f"  {primary}.{code}: {desc}\n")
+        parts.append("\n")
+
+    parts.append(_CATEGORY_USAGE_FOOTER)
+    return "".join(parts)
+
 app = Server("arxiv-server")
 arxiv_client = ArxivClient()
 
-@app.list_tools()
-async def list_tools() -> list[types.Tool]:
-    """List available tools for interacting with arXiv."""
-    return [
-        types.Tool(
-            name="search_papers",
-            description="""Search for papers on arXiv by title and abstract content.
-            
+# Tool input schemas, kept as plain module-level constants. Together with
+# the _TOOLS list below this means pydantic validation of the Tool models
+# fires exactly once at import; list_tools responses reuse the same
+# objects, so the framework never re-validates or rebuilds them per call.
+_TOOL_SCHEMAS = {
+    "search_papers": {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query to match against paper titles and abstracts"
+            },
+            "max_results": {
+                "type": "number",
+                "description": "Maximum number of results to return (default: 10)",
+                "minimum": 1,
+                "maximum": 50
+            }
+        },
+        "required": ["query"]
+    },
+    "get_paper_data": {
+        "type": "object",
+        "properties": {
+            "paper_id": {
+                "type": "string",
+                "description": "arXiv paper ID (e.g., '2103.08220')"
+            }
+        },
+        "required": ["paper_id"]
+    },
+    "list_categories": {
+        "type": "object",
+        "properties": {
+            "primary_category": {
+                "type": "string",
+                "description": "Optional: filter by primary category (e.g., 'cs' for Computer Science)"
+            }
+        }
+    },
+    "update_categories": {
+        "type": "object",
+        "properties": {},
+    },
+}
+
+_TOOLS = [
+    types.Tool(
+        name="search_papers",
+        description="""Search for papers on arXiv by title and abstract content.
+
 You can use advanced search syntax:
 - Search in title: ti:"search terms"
 - Search in abstract: abs:"search terms"
@@ -54,59 +131,29 @@ Examples:
 - "machine learning"  (searches all fields)
 - ti:"neural networks" AND cat:cs.AI  (title with category)
 - au:bengio AND ti:"deep learning"  (author and title)""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query to match against paper titles and abstracts"
-                    },
-                    "max_results": {
-                        "type": "number",
-                        "description": "Maximum number of results to return (default: 10)",
-                        "minimum": 1,
-                        "maximum": 50
-                    }
-                },
-                "required": ["query"]
-            }
-        ),
-        types.Tool(
-            name="get_paper_data",
-            description="Get detailed information about a specific paper including abstract and available formats",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "paper_id": {
-                        "type": "string",
-                        "description": "arXiv paper ID (e.g., '2103.08220')"
-                    }
-                },
-                "required": ["paper_id"]
-            }
-        ),
-        types.Tool(
-            name="list_categories",
-            description="List all available arXiv categories and how to use them in search",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "primary_category": {
-                        "type": "string",
-                        "description": "Optional: filter by primary category (e.g., 'cs' for Computer Science)"
-                    }
-                }
-            }
-        ),
-        types.Tool(
-            name="update_categories",
-            description="Update the stored category taxonomy by fetching the latest version from arxiv.org",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            }
-        )
-    ]
+        inputSchema=_TOOL_SCHEMAS["search_papers"]
+    ),
+    types.Tool(
+        name="get_paper_data",
+        description="Get detailed information about a specific paper including abstract and available formats",
+        inputSchema=_TOOL_SCHEMAS["get_paper_data"]
+    ),
+    types.Tool(
+        name="list_categories",
+        description="List all available arXiv categories and how to use them in search",
+        inputSchema=_TOOL_SCHEMAS["list_categories"]
+    ),
+    types.Tool(
+        name="update_categories",
+        description="Update the stored category taxonomy by fetching the latest version from arxiv.org",
+        inputSchema=_TOOL_SCHEMAS["update_categories"]
+    )
+]
+
+@app.list_tools()
+async def list_tools() -> list[types.Tool]:
+    """List available tools for interacting with arXiv."""
+    return _TOOLS
 
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
@@ -118,106 +165,90 @@ async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
             max_results = min(int(arguments.get("max_results", 10)), 50)
             
             papers = await arxiv_client.search(query, max_results)
-            
+
             # Format results in a readable way
-            result = "Search Results:\n\n"
+            parts = ["Search Results:\n\n"]
             for i, paper in enumerate(papers, 1):
-                result += f"{i}. {paper['title']}\n"
-                result += f"   Authors: {', '.join(paper['authors'])}\n"
-                result += f"   ID: {paper['id']}\n"
-                result += f"   Categories: "
-                if paper['primary_category']:
-                    result += f"Primary: {paper['primary_category']}"
-                if paper['categories']:
-                    result += f", Additional: {', '.join(paper['categories'])}"
-                result += f"\n   Published: {paper['published']}\n"
-                
+                parts.append(f"{i}. {paper.title}\n")
+                parts.append(f"   Authors: {', '.join(paper.authors)}\n")
+                parts.append(f"   ID: {paper.id}\n")
+                parts.append("   Categories: ")
+                if paper.primary_category:
+                    parts.append(f"Primary: {paper.primary_category}")
+                if paper.categories:
+                    parts.append(f", Additional: {', '.join(paper.categories)}")
+                parts.append(f"\n   Published: {paper.published}\n")
+
                 # Add first sentence of abstract
-                abstract_preview = get_first_sentence(paper['summary'])
-                result += f"   Preview: {abstract_preview}\n"
-                result += "\n"
-            
-            return [types.TextContent(type="text", text=result)]
+                abstract_preview = get_first_sentence(paper.summary)
+                parts.append(f"   Preview: {abstract_preview}\n\n")
+
+            return [types.TextContent(type="text", text="".join(parts))]
             
         elif name == "get_paper_data":
             paper_id = arguments["paper_id"]
             paper = await arxiv_client.get_paper(paper_id)
             
             # Format paper details in a readable way with clear sections
-            result = f"Title: {paper['title']}\n\n"
-            
+            parts = [f"Title: {paper.title}\n\n"]
+
             # Metadata section
-            result += "Metadata:\n"
-            result += f"- Authors: {', '.join(paper['authors'])}\n"
-            result += f"- Published: {paper['published']}\n"
-            result += f"- Last Updated: {paper['updated']}\n"
-            result += "- Categories: "
-            if paper['primary_category']:
-                result += f"Primary: {paper['primary_category']}"
-            if paper['categories']:
-                result += f", Additional: {', '.join(paper['categories'])}"
-            result += "\n"
-            
-            if paper['doi']:
-                result += f"- DOI: {paper['doi']}\n"
-            if paper["journal_ref"]:
-                result += f"- Journal Reference: {paper['journal_ref']}\n"
-            
+            parts.append("Metadata:\n")
+            parts.append(f"- Authors: {', '.join(paper.authors)}\n")
+            parts.append(f"- Published: {paper.published}\n")
+            parts.append(f"- Last Updated: {paper.updated}\n")
+            parts.append("- Categories: ")
+            if paper.primary_category:
+                parts.append(f"Primary: {paper.primary_category}")
+            if paper.categories:
+                parts.append(f", Additional: {', '.join(paper.categories)}")
+            parts.append("\n")
+
+            if paper.doi:
+                parts.append(f"- DOI: {paper.doi}\n")
+            if paper.journal_ref:
+                parts.append(f"- Journal Reference: {paper.journal_ref}\n")
+
             # Abstract section
-            result += "\nAbstract:\n"
-            result += paper["summary"]
-            result += "\n"
-            
+            parts.append("\nAbstract:\n")
+            parts.append(paper.summary)
+            parts.append("\n")
+
             # Access options section
-            result += "\nAccess Options:\n"
-            result += "- Abstract page: " + paper["abstract_url"] + "\n"
-            if paper["html_url"]:  # Add HTML version if available
-                result += "- Full text HTML version: " + paper["html_url"] + "\n"
-            result += "- PDF version: " + paper["pdf_url"] + "\n"
-            
+            parts.append("\nAccess Options:\n")
+            parts.append("- Abstract page: " + paper.abstract_url + "\n")
+            if paper.html_url:  # Add HTML version if available
+                parts.append("- Full text HTML version: " + paper.html_url + "\n")
+            parts.append("- PDF version: " + paper.pdf_url + "\n")
+
             # Additional information section
-            if paper["comment"] or "code" in paper["comment"].lower():
-                result += "\nAdditional Information:\n"
-                if paper["comment"]:
-                    result += "- Comment: " + paper["comment"] + "\n"
-            
-            return [types.TextContent(type="text", text=result)]
+            if paper.comment or "code" in paper.comment.lower():
+                parts.append("\nAdditional Information:\n")
+                if paper.comment:
+                    parts.append("- Comment: " + paper.comment + "\n")
+
+            return [types.TextContent(type="text", text="".join(parts))]
 
         elif name == "list_categories":
             try:
-                taxonomy = load_taxonomy()
+                if not TAXONOMY_FILE.exists():
+                    update_taxonomy_file()
+                mtime = os.path.getmtime(TAXONOMY_FILE)
+                text = _render_categories(mtime, arguments.get("primary_category"))
             except Exception as e:
                 logger.error(f"Error loading taxonomy: {e}")
                 return [types.TextContent(type="text", text=f"Error loading category taxonomy. Try using update_categories tool to refresh it.")]
 
-            primary_filter = arguments.get("primary_category")
-            result = "arXiv Categories:\n\n"
-            
-            for primary, data in taxonomy.items():
-                if primary_filter and primary != primary_filter:
-                    continue
-                    
-                result += f"{primary}: {data['name']}\n"
-                for code, desc in data['subcategories'].items():
-                    result += f"  {primary}.{code}: {desc}\n"
-                result += "\n"
-                
-            result += "\nUsage in search:\n"
-            result += '- Search in specific category: cat:cs.AI\n'
-            result += '- Combine with other terms: "neural networks" AND cat:cs.AI\n'
-            result += '- Multiple categories: (cat:cs.AI OR cat:cs.LG)\n'
-            result += '\nNote: If categories seem outdated, use the update_categories tool to refresh them.\n'
-            
-            return [types.TextContent(type="text", text=result)]
+            return [types.TextContent(type="text", text=text)]
 
         elif name == "update_categories":
             try:
                 taxonomy = update_taxonomy_file()
-                result = "Successfully updated category taxonomy.\n\n"
-                result += f"Found {len(taxonomy)} primary categories:\n"
+                parts = ["Successfully updated category taxonomy.\n\n"]
+                parts.append(f"Found {len(taxonomy)} primary categories:\n")
                 for primary, data in taxonomy.items():
-                    result += f"- {primary}: {data['name']} ({len(data['subcategories'])} subcategories)\n"
-                return [types.TextContent(type="text", text=result)]
+                    parts.append(f"- {primary}: {data['name']} ({len(data['subcategories'])} subcategories)\n")
+                return [types.TextContent(type="text", text="".join(parts))]
             except Exception as e:
                 logger.error(f"Error updating taxonomy: {e}")
                 return [types.TextContent(
@@ -243,12 +274,15 @@ async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
 
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+    finally:
+        await arxiv_client.aclose()
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
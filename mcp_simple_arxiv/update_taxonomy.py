@@ -4,33 +4,53 @@ Script to verify and optionally update arXiv category taxonomy.
 
 import json
 from pathlib import Path
+from typing import Optional
 from .categories import CATEGORIES
 
 TAXONOMY_FILE = Path(__file__).parent / "taxonomy.json"
 
+# In-memory taxonomy cache: the taxonomy is small and read on every
+# list_categories call, so keep it resident and only re-read the file
+# when its mtime changes
+_taxonomy_cache: Optional[dict] = None
+_taxonomy_mtime: float = 0.0
+
 def update_taxonomy_file():
     """
     Create taxonomy.json from the built-in categories.
     Returns the taxonomy dictionary.
     """
+    global _taxonomy_cache, _taxonomy_mtime
     print(f"Creating taxonomy file at {TAXONOMY_FILE}...")
     with open(TAXONOMY_FILE, 'w', encoding='utf-8') as f:
         json.dump(CATEGORIES, f, indent=2, ensure_ascii=False)
     print("Done!")
+    _taxonomy_cache = CATEGORIES
+    _taxonomy_mtime = TAXONOMY_FILE.stat().st_mtime
     return CATEGORIES
 
 def load_taxonomy() -> dict:
     """
-    Load taxonomy from the JSON file.
+    Load taxonomy from the JSON file, keeping it cached in memory.
     If file doesn't exist, create it from built-in categories.
+
+    Repeat calls only stat the file; the JSON is re-parsed when the
+    mtime changes (i.e. after update_taxonomy_file rewrites it).
     """
+    global _taxonomy_cache, _taxonomy_mtime
     if not TAXONOMY_FILE.exists():
         print(f"Taxonomy file not found at {TAXONOMY_FILE}, creating it...")
         return update_taxonomy_file()
-    
+
+    mtime = TAXONOMY_FILE.stat().st_mtime
+    if _taxonomy_cache is not None and mtime == _taxonomy_mtime:
+        return _taxonomy_cache
+
     print(f"Loading taxonomy from {TAXONOMY_FILE}")
     with open(TAXONOMY_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        _taxonomy_cache = json.load(f)
+    _taxonomy_mtime = mtime
+    return _taxonomy_cache
 
 if __name__ == "__main__":
     # When run directly, create/update the taxonomy file